@@ -3,31 +3,68 @@ TodoリストWebアプリ - Flaskメインアプリケーション。
 ルーティング・バリデーション・テンプレート描画に専念。
 Sheets操作は sheets_client に委譲。
 """
+import asyncio
+import functools
+import hashlib
+import hmac
 import logging
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from flask import Flask, flash, redirect, render_template, request, url_for
+from flask import (
+    Flask, flash, make_response, redirect, render_template, request, session, url_for,
+)
+from jinja2 import FileSystemBytecodeCache
 
+import line_client
 import sheets_client
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-key-change-in-production")
 
+# コンパイル済みテンプレートをディスクに残し、ワーカー起動ごとの再コンパイルを省く。
+# 保存先は Jinja 既定のユーザー専用ディレクトリ（0700・所有者確認つき）。共有ディレクトリだと
+# 他ユーザーが置いたキャッシュ（marshal 済みコード）を読み込みうるため指定しない
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+# テンプレートの更新確認はデバッグ時（FLASK_DEBUG / app.run(debug=True)）だけ行う
+app.jinja_env.auto_reload = app.debug
+
 logger = logging.getLogger(__name__)
 
 PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
 _PRIORITY_JA = {"High": "高", "Medium": "中", "Low": "低"}
 _STATUS_JA = {"open": "未完了", "done": "完了"}
+_INDEX_ETAG_FIELDS = (
+    "id", "title", "description", "priority", "status", "due_at", "updated_at",
+)
+# デプロイで HTML / CSS / ラベルが変わったら ETag も変える。Cloud Run では K_REVISION が入る
+_APP_VERSION = (os.environ.get("APP_VERSION") or os.environ.get("K_REVISION") or "").strip()
+_APP_FILES = [__file__] + [
+    os.path.join(app.root_path, d, name)
+    for d in ("templates", "static")
+    for name in sorted(os.listdir(os.path.join(app.root_path, d)))
+]
+
+# /cron/remind 用の設定は起動時に一度だけ読む
+_CRON_TOKEN = os.environ.get("CRON_AUTH_TOKEN", "").strip().encode()
+_REMIND_HOURS = sheets_client.env_number("REMIND_WINDOW_HOURS", 24)
+
+# ラベル変換はフィルタ呼び出しを挟まず、テンプレートから dict を直接引く
+app.jinja_env.globals.update(PRIORITY_JA=_PRIORITY_JA)
+
+# LINE 送信とリマインド済み記録はリクエスト外で実行し、Scheduler を待たせない
+_push_executor = ThreadPoolExecutor(max_workers=2)
 
 
 # ── Timezone helper ──────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _get_tz() -> ZoneInfo:
     name = os.environ.get("APP_TIMEZONE", "Asia/Tokyo").strip()
     try:
@@ -40,7 +77,7 @@ def _get_tz() -> ZoneInfo:
 
 @app.template_filter("priority_ja")
 def priority_ja_filter(value):
-    """High→高 / Medium→中 / Low→低"""
+    """High→高 / Medium→中 / Low→低（互換用。テンプレートでは PRIORITY_JA を使う）"""
     return _PRIORITY_JA.get(value, value or "中")
 
 
@@ -56,7 +93,7 @@ def iso_to_date_filter(value):
     if not value:
         return ""
     try:
-        return datetime.fromisoformat(value).strftime("%Y-%m-%d")
+        return date.fromisoformat(value[:10]).isoformat()
     except (ValueError, TypeError):
         return str(value)[:10] if len(str(value)) >= 10 else str(value)
 
@@ -67,7 +104,7 @@ def format_date_filter(value):
     if not value:
         return "-"
     try:
-        return datetime.fromisoformat(value).strftime("%Y-%m-%d")
+        return date.fromisoformat(value[:10]).isoformat()
     except (ValueError, TypeError):
         return str(value)
 
@@ -90,9 +127,8 @@ def _date_to_iso(date_str: str) -> str:
     if not date_str or not date_str.strip():
         return ""
     try:
-        dt = datetime.strptime(date_str.strip(), "%Y-%m-%d")
-        dt = dt.replace(hour=23, minute=59, second=0, tzinfo=_get_tz())
-        return dt.isoformat()
+        d = date.fromisoformat(date_str.strip())
+        return datetime.combine(d, time(23, 59), tzinfo=_get_tz()).isoformat()
     except ValueError:
         return date_str.strip()
 
@@ -105,23 +141,69 @@ def _validate_form(title: str) -> list[str]:
 
 
 def _sort_todos(todos: list[dict], sort_key: str) -> list[dict]:
+    # (キー, 元の位置, Todo) を一度だけ作って並べ替える。位置で同順位を解決するため dict 比較は起きない
     if sort_key == "priority":
-        return sorted(
-            todos,
-            key=lambda t: PRIORITY_RANK.get(t.get("priority", "Medium"), 1),
-        )
-    if sort_key == "due":
-        return sorted(
-            todos,
-            key=lambda t: t.get("due_at") or "\uffff",
-        )
-    if sort_key == "updated":
-        return sorted(
-            todos,
-            key=lambda t: t.get("updated_at") or "",
-            reverse=True,
+        keyed = [
+            (PRIORITY_RANK.get(t.get("priority") or "Medium", 1), i, t)
+            for i, t in enumerate(todos)
+        ]
+        keyed.sort()
+    elif sort_key == "due":
+        keyed = [(t.get("due_at") or "\uffff", i, t) for i, t in enumerate(todos)]
+        keyed.sort()
+    elif sort_key == "updated":
+        # 降順でも同順位は元の並びを保つよう位置を負にする
+        keyed = [(t.get("updated_at") or "", -i, t) for i, t in enumerate(todos)]
+        keyed.sort(reverse=True)
+    else:
+        return todos
+    return [t for _, _, t in keyed]
+
+
+def _build_version() -> str:
+    """ETag に混ぜる版。APP_VERSION / K_REVISION がなければアプリ・テンプレート・静的ファイルの更新時刻。"""
+    if _APP_VERSION:
+        return _APP_VERSION
+    return str(max((os.stat(path).st_mtime_ns for path in _APP_FILES), default=0))
+
+
+def _index_etag(todos: list[dict], sort: str, status_filter: str) -> str:
+    """一覧の表示内容とクエリから ETag を作る。シートを直接編集された場合も変わるよう全表示列を含める。"""
+    h = hashlib.md5(
+        f"{_build_version()}|{sort}|{status_filter}".encode(), usedforsecurity=False
+    )
+    for t in todos:
+        h.update("\x1f".join(str(t.get(k, "")) for k in _INDEX_ETAG_FIELDS).encode())
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+async def _push_and_locate(text: str, todo_ids: list[str]) -> tuple[bool, list[int]]:
+    """LINE 送信と対象行の特定（Sheets 読み取り）を並行して行う。"""
+    sent, row_nums = await asyncio.gather(
+        asyncio.to_thread(line_client.send_push_message, text),
+        sheets_client.async_find_row_numbers(todo_ids),
+    )
+    return sent, row_nums
+
+
+def _do_push_and_mark(due_todos: list[dict]) -> None:
+    """バックグラウンドで LINE 通知を送り、成功時のみ last_reminded_at を更新。"""
+    lines = [f"⏰ {len(due_todos)}件のTodoが期限間近です:"]
+    for t in due_todos:
+        due_disp = t.get("due_at", "")[:16] if t.get("due_at") else "期日なし"
+        lines.append(f"・{t['title']}（期限: {due_disp}）")
+
+    try:
+        sent, row_nums = asyncio.run(
+            _push_and_locate("\n".join(lines), [t["id"] for t in due_todos])
         )
-    return todos
+        if not sent:
+            logger.error("LINE送信失敗のためリマインド済みにしません")
+            return
+        sheets_client.mark_reminded_rows(row_nums)
+    except Exception:
+        logger.exception("リマインド通知の送信に失敗")
 
 
 # ── Routes ───────────────────────────────────────────────────────────
@@ -143,9 +225,18 @@ def index():
 
     todos = _sort_todos(todos, sort)
 
-    return render_template(
-        "index.html", todos=todos, sort=sort, status=status_filter,
-    )
+    # フラッシュメッセージが残っている間は必ず描画する（304 だと表示されない）
+    etag = None if session.get("_flashes") else _index_etag(todos, sort, status_filter)
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        resp = make_response("", 304)
+    else:
+        resp = make_response(render_template(
+            "index.html", todos=todos, sort=sort, status=status_filter,
+        ))
+    if etag is not None:
+        resp.set_etag(etag, weak=True)
+        resp.headers["Cache-Control"] = "private, must-revalidate"
+    return resp
 
 
 @app.route("/new", methods=["GET"])
@@ -262,16 +353,13 @@ def toggle_todo(id: str):
 @app.route("/cron/remind", methods=["POST"])
 def cron_remind():
     """Cloud Scheduler から呼ばれるリマインド通知。X-CRON-TOKEN で認証。"""
-    expected = os.environ.get("CRON_AUTH_TOKEN", "").strip()
     provided = request.headers.get("X-CRON-TOKEN", "").strip()
 
-    if not expected or provided != expected:
+    if not _CRON_TOKEN or not hmac.compare_digest(_CRON_TOKEN, provided.encode()):
         return {"error": "forbidden"}, 403
 
-    hours = int(os.environ.get("REMIND_WINDOW_HOURS", "24"))
-
     try:
-        due_todos = sheets_client.find_due_within(hours=hours)
+        due_todos = sheets_client.find_due_within(hours=_REMIND_HOURS)
     except Exception as e:
         logger.exception("リマインド対象の取得に失敗")
         return {"error": str(e)}, 500
@@ -279,17 +367,8 @@ def cron_remind():
     if not due_todos:
         return {"message": "対象Todoなし", "count": 0}, 200
 
-    lines = [f"⏰ {len(due_todos)}件のTodoが期限間近です:"]
-    for t in due_todos:
-        due_disp = t.get("due_at", "")[:16] if t.get("due_at") else "期日なし"
-        lines.append(f"・{t['title']}（期限: {due_disp}）")
-
-    import line_client
-    if line_client.send_push_message("\n".join(lines)):
-        sheets_client.mark_reminded([t["id"] for t in due_todos])
-        return {"message": "通知完了", "count": len(due_todos)}, 200
-
-    return {"error": "LINE送信失敗"}, 502
+    _push_executor.submit(_do_push_and_mark, due_todos)
+    return {"message": "通知を受け付けました", "count": len(due_todos)}, 202
 
 
 @app.errorhandler(500)
@@ -3,9 +3,16 @@ import logging
 import os
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+PUSH_URL = "https://api.line.me/v2/bot/message/push"
+
+# 接続を使い回し、連続送信時の DNS 解決・TLS ハンドシェイクを省く
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 
 def send_push_message(text: str) -> bool:
     """LINE Push API でテキストメッセージを送信。成功時 True。"""
@@ -20,8 +27,8 @@ def send_push_message(text: str) -> bool:
         return False
 
     try:
-        resp = requests.post(
-            "https://api.line.me/v2/bot/message/push",
+        resp = _session.post(
+            PUSH_URL,
             headers={
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {token}",
@@ -4,25 +4,64 @@ GoogleスプレッドシートをTodoの永続化先として利用するクラ
 """
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
 import json
+import logging
 import os
-import uuid
+import random
+import re
+import secrets
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-import google.auth
-import gspread
-from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+
+import todo_mirror
+
+# gspread / google-auth は import が重いので、Sheets に初めて触れる関数の中で読み込む
+# （ヘルスチェックなど Sheets を使わないリクエストのコールドスタートを短くする）。
+
+logger = logging.getLogger(__name__)
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
 ]
 
-HEADERS = [
+HEADERS = (
     "id", "title", "description", "priority", "status",
     "due_at", "created_at", "updated_at", "done_at", "last_reminded_at",
-]
+)
+
+# 一覧表示・並び替えに必要な先頭列（id〜updated_at = A〜H）。done_at / last_reminded_at は含まない。
+LIST_COLS = HEADERS[: HEADERS.index("updated_at") + 1]
+
+# 列位置と読み書き範囲は固定なので起動時に組み立てておく
+_HEADER_INDEX = {h: i for i, h in enumerate(HEADERS)}
+_END_COL = chr(ord("A") + len(HEADERS) - 1)
+_LIST_END_COL = chr(ord("A") + len(LIST_COLS) - 1)
+_HEADER_RANGE = f"A1:{_END_COL}1"
+_LIST_RANGE = f"A2:{_LIST_END_COL}"
+_ALL_RANGE = f"A2:{_END_COL}"
+_FULL_ROW_RANGE = f"A%d:{_END_COL}%d"
+# update_todo が書き換えるセル（title〜priority / due_at / updated_at）
+_EDIT_FIELDS_RANGE = (
+    f"{chr(ord('A') + _HEADER_INDEX['title'])}%d:{chr(ord('A') + _HEADER_INDEX['priority'])}%d"
+)
+_DUE_AT_RANGE = f"{chr(ord('A') + _HEADER_INDEX['due_at'])}%d"
+_UPDATED_AT_RANGE = f"{chr(ord('A') + _HEADER_INDEX['updated_at'])}%d"
+# 書き込み前の確認用（id のみ / id〜status）と、toggle_status が書き換えるセル
+_ID_CELL_RANGE = "A%d:A%d"
+_STATUS_ROW_RANGE = f"A%d:{chr(ord('A') + _HEADER_INDEX['status'])}%d"
+_STATUS_RANGE = f"{chr(ord('A') + _HEADER_INDEX['status'])}%d"
+_UPDATED_DONE_RANGE = (
+    f"{chr(ord('A') + _HEADER_INDEX['updated_at'])}%d:{chr(ord('A') + _HEADER_INDEX['done_at'])}%d"
+)
 
 _OLD_TO_NEW = {"body": "description", "due_date": "due_at"}
 
@@ -30,8 +69,61 @@ VALID_PRIORITIES = {"High", "Medium", "Low"}
 VALID_STATUSES = {"open", "done"}
 
 
+def env_number(name: str, default):
+    """数値の環境変数を default と同じ型で読む。不正な値なら警告して default（起動は止めない）。"""
+    try:
+        return type(default)(os.environ.get(name, default))
+    except ValueError:
+        logger.warning("%s の値が不正なため既定値 %s を使います", name, default)
+        return default
+
+
+# 環境変数由来の設定は import 時に一度だけ読む（app.py は import 前に load_dotenv 済み）
+_SPREADSHEET_ID = os.environ.get("SPREADSHEET_ID", "").strip()
+_SHEET_NAME = os.environ.get("SHEET_NAME", "todos").strip() or "todos"
+_ID_INDEX_TTL = env_number("ID_INDEX_TTL_SECONDS", 3600.0)
+_TODOS_CACHE_TTL = env_number("TODOS_CACHE_TTL", 0.0)
+_API_WARN_CALLS = env_number("SHEETS_API_WARN_CALLS", 6)
+_MIRROR_REFRESH = env_number("TODO_MIRROR_REFRESH_SECONDS", 0.0)
+
+# 認証情報・gspread クライアント・Spreadsheet・Worksheet をプロセス内で使い回す。
+# トークン更新は google-auth の AuthorizedSession が自動で行う。
+_CLIENT_CACHE = {
+    "creds": None,
+    "session": None,
+    "client": None,
+    "spreadsheet": None,
+    "worksheet": None,
+}
+_sheet_lock = threading.Lock()
+
+# ヘッダ確認はプロセス内で一度だけ行い、列マップも合わせて保持する。
+_headers_verified = False
+_cached_hmap: dict[str, int] = {}
+# 起動直後に複数スレッドが同時に来ても、ヘッダ確認・マイグレーションは1回だけ行う
+_header_lock = threading.Lock()
+# ヘッダ行の書き込みが必要な場合は、次の書き込みと同じ batchUpdate にまとめて送る
+_pending_header_write = False
+
+# {id: 行番号} の対応表。行は末尾追加のみで移動しないため長め（既定1時間）に保持し、
+# 読んだ行の id が一致しない・例外が起きた場合は破棄して id 列から作り直す。
+_ID_INDEX: dict[str, int] | None = None
+_id_index_ts = 0.0
+
+# 一覧（fetch_all_todos）の TTL キャッシュ。既定は無効（0秒）で、TODOS_CACHE_TTL で有効化する。
+# 複数ワーカー構成では他ワーカーの書き込みが TTL の間は見えないため opt-in にしている。
+_TODO_CACHE = {"data": None, "ts": 0.0, "gen": 0, "loading": None}
+_todo_cache_lock = threading.Lock()
+
+# 読み取り用の SQLite ミラー（todo_mirror）。既定は無効で、TODO_MIRROR_REFRESH_SECONDS で有効化する。
+# 書き込みは Sheets に反映してからミラーにも反映し、シートの手編集は定期取り込みで拾う。
+# ミラーはワーカーごとなので、他ワーカーの書き込みは次の取り込みまで見えない（単一ワーカー向け）。
+_mirror_lock = threading.Lock()
+
+
 # ── Timezone helpers ─────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _get_tz() -> ZoneInfo:
     name = os.environ.get("APP_TIMEZONE", "Asia/Tokyo").strip()
     try:
@@ -41,7 +133,8 @@ def _get_tz() -> ZoneInfo:
 
 
 def _now_iso() -> str:
-    return datetime.now(_get_tz()).isoformat()
+    # 秒単位で十分なのでマイクロ秒は付けない（セル値も短くなる）
+    return datetime.now(_get_tz()).isoformat(timespec="seconds")
 
 
 def _parse_iso(value: str) -> datetime | None:
@@ -56,6 +149,14 @@ def _parse_iso(value: str) -> datetime | None:
 # ── Google Auth ──────────────────────────────────────────────────────
 
 def _get_google_credentials():
+    """キャッシュ済みの認証情報を返す。初回のみ _load_google_credentials を呼ぶ。"""
+    creds = _CLIENT_CACHE["creds"]
+    if creds is None:
+        creds = _CLIENT_CACHE["creds"] = _load_google_credentials()
+    return creds
+
+
+def _load_google_credentials():
     """
     Google 認証情報を取得。
     優先順位: 1) JSON_PATH  2) JSON文字列  3) ADC (Cloud Run SA)
@@ -65,9 +166,8 @@ def _get_google_credentials():
         path = os.path.expanduser(path)
         if not os.path.isfile(path):
             raise RuntimeError(f"認証ファイルが見つかりません: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            info = json.load(f)
-        return Credentials.from_service_account_info(info, scopes=SCOPES)
+        # ファイルが更新されたときだけ読み直す
+        return _load_creds_from_file(path, os.path.getmtime(path))
 
     json_str = os.environ.get("GOOGLE_SERVICE_ACCOUNT_JSON")
     if json_str:
@@ -76,14 +176,9 @@ def _get_google_credentials():
             raise RuntimeError(
                 "GOOGLE_SERVICE_ACCOUNT_JSON が空です。正しいJSON文字列を設定してください。"
             )
-        try:
-            info = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            raise RuntimeError(
-                f"GOOGLE_SERVICE_ACCOUNT_JSON のJSON解析に失敗しました: {e}. "
-                "JSONは1行（minify）で貼り付けてください。"
-            )
-        return Credentials.from_service_account_info(info, scopes=SCOPES)
+        return _load_creds_from_json(json_str)
+
+    import google.auth
 
     try:
         creds, _project_id = google.auth.default(scopes=SCOPES)
@@ -100,45 +195,250 @@ def _get_google_credentials():
     return creds
 
 
+@functools.lru_cache(maxsize=4)
+def _load_creds_from_file(path: str, mtime: float):
+    from google.oauth2.service_account import Credentials
+
+    return Credentials.from_service_account_file(path, scopes=SCOPES)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_creds_from_json(json_str: str):
+    from google.oauth2.service_account import Credentials
+
+    try:
+        info = json.loads(json_str)
+    except json.JSONDecodeError as e:
+        raise RuntimeError(
+            f"GOOGLE_SERVICE_ACCOUNT_JSON のJSON解析に失敗しました: {e}. "
+            "JSONは1行（minify）で貼り付けてください。"
+        )
+    return Credentials.from_service_account_info(info, scopes=SCOPES)
+
+
+# ── Retry ────────────────────────────────────────────────────────────
+
+# クォータ超過（429）や一時的なサーバーエラーは指数バックオフ + ジッターで再試行する
+_RETRY_STATUSES = {429, 500, 503}
+
+
+def _retry(fn, *args, retries: int = 5, base: float = 0.5, cap: float = 8.0,
+           jitter: float = 0.5, statuses=_RETRY_STATUSES, **kwargs):
+    """fn を呼び、statuses に該当する APIError なら最大 retries 回まで再試行する。"""
+    import gspread
+
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = getattr(e.response, "status_code", e.code)
+            if status not in statuses or attempt == retries:
+                raise
+            time.sleep(min(cap, base * 2 ** attempt) + random.uniform(0, jitter))
+
+
+@functools.lru_cache(maxsize=1)
+def _retry_http_client():
+    """すべての Sheets API 呼び出しを _retry 経由にする gspread の HTTP クライアントクラスを返す。
+
+    基底クラスの import を遅らせるため、初回呼び出し時にクラスを定義する。
+    """
+    from gspread.http_client import HTTPClient
+
+    class _RetryHTTPClient(HTTPClient):
+        def request(self, method, endpoint, *args, **kwargs):
+            send = super().request
+
+            def _send():
+                _record_api_call(method, endpoint)
+                return send(method, endpoint, *args, **kwargs)
+
+            # append は 5xx だと書き込み済みの可能性があり、再送で行が重複しうるので 429 のみ再試行
+            statuses = {429} if ":append" in endpoint else _RETRY_STATUSES
+            return _retry(_send, statuses=statuses)
+
+    return _RetryHTTPClient
+
+
+# ── API call stats ───────────────────────────────────────────────────
+
+# Sheets/Drive API の呼び出し回数を「メソッド + エンドポイント」単位で数える。
+# プロセス全体の累計に加え、公開関数1回あたりの回数を ContextVar で分けて集計する。
+_api_stats: Counter = Counter()
+_api_stats_lock = threading.Lock()
+_op_calls: contextvars.ContextVar[Counter | None] = contextvars.ContextVar(
+    "sheets_op_calls", default=None
+)
+_ENDPOINT_ID_RE = re.compile(r"/(spreadsheets|files)/[^/:?]+")
+_ENDPOINT_RANGE_RE = re.compile(r"/values/[^/:?]+")
+
+
+def _record_api_call(method: str, endpoint: str) -> None:
+    path = endpoint.split("googleapis.com", 1)[-1]
+    path = _ENDPOINT_ID_RE.sub(r"/\1/{id}", path)
+    path = _ENDPOINT_RANGE_RE.sub("/values/{range}", path)
+    key = f"{method.upper()} {path}"
+    with _api_stats_lock:
+        _api_stats[key] += 1
+    per_op = _op_calls.get()
+    if per_op is not None:
+        per_op[key] += 1
+
+
+def get_api_stats() -> dict[str, int]:
+    """プロセス起動以降の API 呼び出し回数を {"METHOD /path": 回数} で返す。"""
+    with _api_stats_lock:
+        return dict(_api_stats)
+
+
+def reset_api_stats() -> None:
+    with _api_stats_lock:
+        _api_stats.clear()
+
+
+def _tracked(fn):
+    """1回の論理操作での API 呼び出し回数を数え、しきい値を超えたら警告を出す。"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _op_calls.get() is not None:
+            # 入れ子の呼び出しは外側の操作に合算する
+            return fn(*args, **kwargs)
+        calls: Counter = Counter()
+        token = _op_calls.set(calls)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _op_calls.reset(token)
+            total = sum(calls.values())
+            if total > _API_WARN_CALLS:
+                logger.warning(
+                    "%s で Sheets API を %d 回呼び出しました: %s",
+                    fn.__name__, total, dict(calls),
+                )
+    return wrapper
+
+
 # ── Sheet access ─────────────────────────────────────────────────────
 
+def _get_session():
+    """接続プールを持つ AuthorizedSession を返す（TLS 接続を使い回す）。"""
+    session = _CLIENT_CACHE["session"]
+    if session is None:
+        from google.auth.transport.requests import AuthorizedSession
+
+        session = AuthorizedSession(_get_google_credentials())
+        session.mount(
+            "https://", HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        )
+        _CLIENT_CACHE["session"] = session
+    return session
+
+
 def _get_client():
-    spreadsheet_id = os.environ.get("SPREADSHEET_ID", "").strip()
+    """キャッシュ済みの Spreadsheet を返す。初回のみ認証と open_by_key を行う。"""
+    spreadsheet = _CLIENT_CACHE["spreadsheet"]
+    if spreadsheet is not None:
+        return spreadsheet
+    # 起動時に未設定だった場合のみ読み直す
+    spreadsheet_id = _SPREADSHEET_ID or os.environ.get("SPREADSHEET_ID", "").strip()
     if not spreadsheet_id:
         raise RuntimeError(
             "SPREADSHEET_ID が設定されていません。"
             "スプレッドシートURLの /d/ と /edit の間の文字列を設定してください。"
         )
-    creds = _get_google_credentials()
-    client = gspread.authorize(creds)
-    return client.open_by_key(spreadsheet_id)
+    client = _CLIENT_CACHE["client"]
+    if client is None:
+        import gspread
+
+        client = _CLIENT_CACHE["client"] = gspread.authorize(
+            _get_google_credentials(),
+            http_client=_retry_http_client(),
+            session=_get_session(),
+        )
+    spreadsheet = _CLIENT_CACHE["spreadsheet"] = client.open_by_key(spreadsheet_id)
+    return spreadsheet
 
 
 def _get_sheet():
-    spreadsheet = _get_client()
-    sheet_name = os.environ.get("SHEET_NAME", "todos").strip() or "todos"
-    return spreadsheet.worksheet(sheet_name)
-
+    """キャッシュ済みの Worksheet を返す。初回のみ認証・シート取得を行う。"""
+    sheet = _CLIENT_CACHE["worksheet"]
+    if sheet is not None:
+        return sheet
+    with _sheet_lock:
+        if _CLIENT_CACHE["worksheet"] is None:
+            spreadsheet = _get_client()
+            _CLIENT_CACHE["worksheet"] = spreadsheet.worksheet(_SHEET_NAME)
+        return _CLIENT_CACHE["worksheet"]
+
+
+def _reset_sheet_cache() -> None:
+    """認証情報〜Worksheet のキャッシュをすべて破棄（テスト・設定変更用）。"""
+    with _sheet_lock:
+        session = _CLIENT_CACHE["session"]
+        if session is not None:
+            session.close()
+        for key in _CLIENT_CACHE:
+            _CLIENT_CACHE[key] = None
+
+
+def _get_ranges(ranges: list[str]) -> dict[str, list[list[str]]]:
+    """複数の範囲を values.batchGet 1回で読み、{範囲: 値} で返す。
+
+    シート名のない範囲は SHEET_NAME のシートとして扱う。別タブの範囲も "labels!A2:B" のように混ぜられる。
+    """
+    from gspread.utils import absolute_range_name
 
-# ── Header / Migration ──────────────────────────────────────────────
+    sheet = _get_sheet()
+    resp = sheet.spreadsheet.values_batch_get(
+        [r if "!" in r else absolute_range_name(sheet.title, r) for r in ranges]
+    )
+    # 応答の range は正規化された表記になるので、要求した順に対応づける
+    return {
+        r: value_range.get("values", [])
+        for r, value_range in zip(ranges, resp.get("valueRanges", []))
+    }
 
-def get_header_map(worksheet) -> dict[str, int]:
-    """ヘッダ行を読み取り {列名: 0-based index} を返す。"""
-    return {h: i for i, h in enumerate(worksheet.row_values(1)) if h}
 
+# ── Header / Migration ──────────────────────────────────────────────
 
 def _col_letter(index: int) -> str:
     return chr(ord("A") + index)
 
 
+def _batch_write(worksheet, data: list[dict]) -> None:
+    """[{range, values}, ...] を values.batchUpdate 1回で書き込む。
+
+    未反映のヘッダ行があれば同じリクエストに含める。
+    """
+    global _pending_header_write
+    if _pending_header_write:
+        data = [{"range": _HEADER_RANGE, "values": [list(HEADERS)]}] + list(data)
+    if not data:
+        return
+    from gspread.utils import absolute_range_name
+
+    title = worksheet.title
+    worksheet.spreadsheet.values_batch_update({
+        "valueInputOption": "USER_ENTERED",
+        "data": [
+            {
+                "range": absolute_range_name(title, d["range"]),
+                "values": d["values"],
+            }
+            for d in data
+        ],
+    })
+    _pending_header_write = False
+
+
 def _ensure_headers(worksheet) -> None:
     """ヘッダ行が新フォーマットであることを保証。旧形式なら自動マイグレーション。"""
-    try:
-        current = worksheet.row_values(1)
-    except Exception:
-        current = []
+    global _pending_header_write
+    # 読み取りに失敗したら例外をそのまま返し、確認済みにしない（次のリクエストで再確認する）。
+    # 空扱いにすると旧形式シートのマイグレーションを飛ばし、ヘッダ行だけを上書きしてしまう
+    current = worksheet.row_values(1)
 
-    if current == HEADERS:
+    if tuple(current) == HEADERS:
         return
 
     needs_migration = (
@@ -149,6 +449,7 @@ def _ensure_headers(worksheet) -> None:
     )
 
     if needs_migration:
+        _reset_header_cache()
         all_values = worksheet.get_all_values()
         old_headers = all_values[0]
         data_rows = all_values[1:]
@@ -173,62 +474,289 @@ def _ensure_headers(worksheet) -> None:
                     new_row.append("open")
                 else:
                     new_row.append("")
+            new_row[0] = _as_text(new_row[0])
             migrated.append(new_row)
 
-        worksheet.clear()
-        end_col = _col_letter(len(HEADERS) - 1)
-        worksheet.update(
-            f"A1:{end_col}{1 + len(migrated)}",
-            [HEADERS] + migrated,
-            value_input_option="USER_ENTERED",
-        )
+        # clear() を挟まず1回の batchUpdate で上書きし、シートが空になる瞬間を作らない
+        _batch_write(worksheet, [{
+            "range": f"A1:{_END_COL}{1 + len(migrated)}",
+            "values": [list(HEADERS)] + migrated,
+        }])
+        # 旧シートが新フォーマットより横に広い場合のみ、はみ出た列を消す
+        old_width = max((len(r) for r in all_values), default=0)
+        if old_width > len(HEADERS):
+            from gspread.utils import absolute_range_name, rowcol_to_a1
+
+            tail = "%s:%s" % (
+                rowcol_to_a1(1, len(HEADERS) + 1),
+                rowcol_to_a1(len(all_values), old_width),
+            )
+            worksheet.spreadsheet.values_clear(
+                absolute_range_name(worksheet.title, tail)
+            )
         return
 
-    end_col = _col_letter(len(HEADERS) - 1)
-    worksheet.update(
-        f"A1:{end_col}1", [HEADERS], value_input_option="USER_ENTERED"
-    )
+    # 読み取りは列位置で行うためヘッダ行がなくても困らない。次の書き込みに相乗りさせる
+    _pending_header_write = True
+
+
+def _ensure_headers_once(worksheet) -> dict[str, int]:
+    """初回のみ _ensure_headers を実行し、以降はキャッシュ済みの列マップを返す。"""
+    global _headers_verified, _cached_hmap
+    if _headers_verified:
+        return _cached_hmap
+    with _header_lock:
+        if not _headers_verified:
+            _ensure_headers(worksheet)
+            # _ensure_headers 完了後のヘッダ行は HEADERS と一致する（未反映分は次の書き込みで送る）
+            _cached_hmap = _HEADER_INDEX
+            _headers_verified = True
+    return _cached_hmap
+
+
+def _reset_header_cache() -> None:
+    """ヘッダ確認済みフラグと列マップを破棄（テスト・マイグレーション用）。"""
+    global _headers_verified, _cached_hmap, _pending_header_write
+    _headers_verified = False
+    _cached_hmap = {}
+    _pending_header_write = False
+
+
+def reset_header_cache() -> None:
+    """ヘッダ確認をやり直させる（テスト・シートを手で作り直したとき用）。"""
+    with _header_lock:
+        _reset_header_cache()
 
 
 # ── Row helpers ──────────────────────────────────────────────────────
 
-def _row_to_dict(row: list, hmap: dict[str, int]) -> dict:
+def _as_text(value: str) -> str:
+    """USER_ENTERED で書くセルを文字列のまま保存させる（先頭の ' はシート上に表示されない）。
+
+    16進の id は "123e4567..." のように数値（指数表記）と解釈されうるため、id 列に使う。
+    """
+    return "'" + value if value else value
+
+
+def _row_to_dict(row: list, hmap: dict[str, int] = _HEADER_INDEX) -> dict:
     return {h: (row[i] if i < len(row) else "") for h, i in hmap.items()}
 
 
-def _dict_to_row(data: dict) -> list:
-    return [str(data.get(h, "")) for h in HEADERS]
+def _add_display_fields(todo: dict) -> dict:
+    """一覧表示用の整形済み文字列を付与（テンプレートでの日付パースを省く）。"""
+    due_at = todo.get("due_at")
+    todo["due_at_disp"] = due_at[:10] if due_at else "-"
+    return todo
+
+
+# ── Row index cache ──────────────────────────────────────────────────
+
+def _store_id_index(ids: list[str], start: int = 2) -> None:
+    """id 列の値（start 行目から）で {id: 行番号} を作り直す。"""
+    global _ID_INDEX, _id_index_ts
+    # 数千行でも Python のループを回さないよう dict(zip(...)) で組み立て、空セルだけ後で除く
+    index = dict(zip(ids, range(start, start + len(ids))))
+    index.pop("", None)
+    _ID_INDEX = index
+    _id_index_ts = time.monotonic()
+
+
+def _id_index_fresh() -> bool:
+    return _ID_INDEX is not None and time.monotonic() - _id_index_ts < _ID_INDEX_TTL
+
+
+def _reset_id_index() -> None:
+    """id→行番号の対応表を破棄（行の不一致・例外時・テスト用）。"""
+    global _ID_INDEX, _id_index_ts
+    _ID_INDEX = None
+    _id_index_ts = 0.0
+
+
+def _invalidate_todo_cache() -> None:
+    """一覧キャッシュを破棄。取得中のデータも世代番号で無効にする。"""
+    with _todo_cache_lock:
+        _TODO_CACHE["data"] = None
+        _TODO_CACHE["ts"] = 0.0
+        _TODO_CACHE["gen"] += 1
+
+
+def _appended_row_num(response) -> int | None:
+    """append の応答（updates.updatedRange）から追加された行番号を取り出す。"""
+    import gspread
+
+    try:
+        updated = response["updates"]["updatedRange"]
+        start = updated.rsplit("!", 1)[-1].split(":")[0]
+        return gspread.utils.a1_to_rowcol(start)[0]
+    except (KeyError, TypeError, IndexError, gspread.exceptions.IncorrectCellLabel):
+        return None
+
+
+def _find_row_index(worksheet, todo_id: str, refresh: bool = False) -> int | None:
+    """指定IDの行番号（1-based）を返す。対応表になければ id 列だけを読んで作り直す。"""
+    if not refresh and _id_index_fresh():
+        row_num = _ID_INDEX.get(todo_id)
+        if row_num is not None:
+            return row_num
+    hmap = _ensure_headers_once(worksheet)
+    ids = worksheet.col_values(hmap.get("id", 0) + 1)
+    _store_id_index(ids[1:])
+    return _ID_INDEX.get(todo_id)
+
+
+def _read_row(worksheet, todo_id: str, row_range: str) -> tuple[int, list] | None:
+    """指定IDの行を row_range（A 列から始まる範囲）で読み、(行番号, 値) を返す。
+
+    読んだ行の id が一致することを必ず確かめるので、書き込み先の特定にも使える。
+    """
+    try:
+        row_num = _find_row_index(worksheet, todo_id)
+        if row_num is None:
+            return None
+        values = worksheet.get(row_range % (row_num, row_num))
+        row = values[0] if values else []
+        if not row or row[0] != todo_id:
+            # シートが手で並べ替え・削除された場合など。id 列から引き直す
+            row_num = _find_row_index(worksheet, todo_id, refresh=True)
+            if row_num is None:
+                return None
+            values = worksheet.get(row_range % (row_num, row_num))
+            row = values[0] if values else []
+            if not row or row[0] != todo_id:
+                return None
+    except Exception:
+        _reset_id_index()
+        raise
+    return row_num, row
+
+
+# ── Sheet reads ──────────────────────────────────────────────────────
+
+def _fetch_rows(columns: tuple[str, ...], data_range: str) -> list[tuple[int, dict]]:
+    """data_range（A2 から columns 分の列）を取得し、(行番号, Todo) の一覧で返す。"""
+    sheet = _get_sheet()
+    _ensure_headers_once(sheet)
+    # ヘッダ確認済みなので列位置は HEADERS と一致する（id は常に A 列）。ヘッダ行は読まない
+    width = len(columns)
+    rows = _get_ranges([data_range])[data_range]
+    found = []
+    for row_num, row in enumerate(rows, start=2):
+        if row and row[0]:
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            found.append((row_num, dict(zip(columns, row))))
+    _store_id_index([row[0] if row else "" for row in rows])
+    return found
+
+
+def _fetch_todos(columns: tuple[str, ...], data_range: str) -> list[dict]:
+    """data_range（A2 から columns 分の列）を取得し、dict一覧で返す。"""
+    return [_add_display_fields(todo) for _row_num, todo in _fetch_rows(columns, data_range)]
+
+
+# ── SQLite mirror ────────────────────────────────────────────────────
+
+def _mirror_ready() -> bool:
+    """ミラーが有効なら True。初回は Sheets から全件を取り込み、定期取り込みスレッドを起動する。"""
+    if _MIRROR_REFRESH <= 0:
+        return False
+    if todo_mirror.is_open():
+        return True
+    with _mirror_lock:
+        if not todo_mirror.is_open():
+            todo_mirror.open_mirror(HEADERS, _fetch_rows(HEADERS, _ALL_RANGE))
+            threading.Thread(target=_mirror_loop, name="todo-mirror", daemon=True).start()
+    return True
+
+
+def _refresh_mirror() -> None:
+    """Sheets から全件を読み直してミラーを置き換える。取り込み中に書き込みがあれば次回に回す。"""
+    gen = todo_mirror.write_gen()
+    rows = _fetch_rows(HEADERS, _ALL_RANGE)
+    if not todo_mirror.replace_all(rows, gen):
+        logger.debug("SQLite ミラーの取り込みを見送りました（取り込み中に書き込みあり）")
+
+
+def _mirror_loop() -> None:
+    while todo_mirror.is_open():
+        time.sleep(_MIRROR_REFRESH)
+        try:
+            _refresh_mirror()
+        except Exception:
+            logger.exception("SQLite ミラーの取り込みに失敗しました")
 
 
 # ── CRUD ─────────────────────────────────────────────────────────────
 
+
+@_tracked
 def fetch_all_todos() -> list[dict]:
-    """全Todoを取得。ヘッダ行を動的解決してdict一覧で返す。"""
-    sheet = _get_sheet()
-    _ensure_headers(sheet)
-    hmap = get_header_map(sheet)
-    rows = sheet.get_all_values()
-    id_col = hmap.get("id", 0)
-    return [
-        _row_to_dict(row, hmap)
-        for row in rows[1:]
-        if row and len(row) > id_col and row[id_col]
-    ]
+    """一覧用に全Todoを取得（LIST_COLS の列のみ）。TODOS_CACHE_TTL 秒間はキャッシュを返す。
 
+    SQLite ミラーが有効な場合はミラーから全列を返す。
+    """
+    if _mirror_ready():
+        return [_add_display_fields(todo) for todo in todo_mirror.all_todos()]
+    ttl = _TODOS_CACHE_TTL
+    if ttl <= 0:
+        return _fetch_todos(LIST_COLS, _LIST_RANGE)
+
+    while True:
+        with _todo_cache_lock:
+            data = _TODO_CACHE["data"]
+            if data is not None and time.monotonic() - _TODO_CACHE["ts"] < ttl:
+                return list(data)
+            loading = _TODO_CACHE["loading"]
+            if loading is None:
+                # このスレッドが取得を担当し、同時に来たスレッドは完了を待つ（single-flight）
+                loading = _TODO_CACHE["loading"] = threading.Event()
+                gen = _TODO_CACHE["gen"]
+                break
+        loading.wait()
 
+    try:
+        data = _fetch_todos(LIST_COLS, _LIST_RANGE)
+        with _todo_cache_lock:
+            if _TODO_CACHE["gen"] == gen:
+                _TODO_CACHE["data"] = data
+                _TODO_CACHE["ts"] = time.monotonic()
+        return list(data)
+    finally:
+        with _todo_cache_lock:
+            _TODO_CACHE["loading"] = None
+        loading.set()
+
+
+@_tracked
 def fetch_todo_by_id(todo_id: str) -> dict | None:
-    """指定IDのTodoを1件取得。見つからなければ None。"""
-    sheet = _get_sheet()
-    _ensure_headers(sheet)
-    hmap = get_header_map(sheet)
-    rows = sheet.get_all_values()
-    id_col = hmap.get("id", 0)
-    for row in rows[1:]:
-        if len(row) > id_col and row[id_col] == todo_id:
-            return _row_to_dict(row, hmap)
-    return None
+    """指定IDのTodoを1件取得。見つからなければ None。
+
+    編集画面の元データになるため、一覧キャッシュや SQLite ミラーは使わず常にシートの該当行を読む
+    （他ワーカーやシート上で直前に変更された内容を取りこぼさない）。
+    """
+    found = _read_row(_get_sheet(), todo_id, _FULL_ROW_RANGE)
+    if found is None:
+        return None
+    return _row_to_dict(found[1])
+
+
+def _new_row(title: str, description: str, priority: str, due_at: str, now: str) -> list:
+    """新規Todoの行を HEADERS の並び順どおりに直接組み立てる。"""
+    return [
+        secrets.token_hex(16),
+        title,
+        description,
+        priority if priority in VALID_PRIORITIES else "Medium",
+        "open",
+        due_at,
+        now,
+        now,
+        "",
+        "",
+    ]
 
 
+@_tracked
 def create_todo(
     title: str,
     description: str = "",
@@ -236,24 +764,56 @@ def create_todo(
     due_at: str = "",
 ) -> None:
     """新規Todoを1件登録。status は常に "open" で作成。"""
-    sheet = _get_sheet()
-    _ensure_headers(sheet)
-    now = _now_iso()
-    data = {
-        "id": str(uuid.uuid4()),
+    create_todos([{
         "title": title,
         "description": description,
-        "priority": priority if priority in VALID_PRIORITIES else "Medium",
-        "status": "open",
+        "priority": priority,
         "due_at": due_at,
-        "created_at": now,
-        "updated_at": now,
-        "done_at": "",
-        "last_reminded_at": "",
-    }
-    sheet.append_row(_dict_to_row(data), value_input_option="USER_ENTERED")
+    }])
 
 
+@_tracked
+def create_todos(items: list[dict]) -> None:
+    """複数のTodoを1回の append でまとめて登録。各要素は title / description / priority / due_at を持つ。"""
+    if not items:
+        return
+    sheet = _get_sheet()
+    _ensure_headers_once(sheet)
+    if _pending_header_write:
+        # append はヘッダ行を基準に末尾を探すので、先にヘッダを書いておく
+        _batch_write(sheet, [])
+    now = _now_iso()
+    rows = [
+        _new_row(
+            item.get("title", ""),
+            item.get("description", ""),
+            item.get("priority", "Medium"),
+            item.get("due_at", ""),
+            now,
+        )
+        for item in items
+    ]
+    resp = sheet.append_rows(
+        [[_as_text(row[0])] + row[1:] for row in rows],
+        value_input_option="USER_ENTERED",
+        insert_data_option="INSERT_ROWS",
+        table_range="A1",
+    )
+    start = _appended_row_num(resp)
+    _invalidate_todo_cache()
+    if start is None:
+        _reset_id_index()
+        return
+    todo_mirror.insert([
+        (row_num, dict(zip(HEADERS, row))) for row_num, row in enumerate(rows, start=start)
+    ])
+    # 末尾への追加は既存行の位置を変えないので、対応表に追記するだけでよい
+    if _ID_INDEX is not None:
+        for row_num, row in enumerate(rows, start=start):
+            _ID_INDEX[row[0]] = row_num
+
+
+@_tracked
 def update_todo(
     todo_id: str,
     title: str,
@@ -261,118 +821,184 @@ def update_todo(
     priority: str = "Medium",
     due_at: str = "",
 ) -> None:
-    """指定IDのTodoを更新。status / done_at / last_reminded_at は既存値を維持。"""
+    """指定IDのTodoを更新。status / created_at / done_at / last_reminded_at は既存値を維持。"""
     sheet = _get_sheet()
-    _ensure_headers(sheet)
-    hmap = get_header_map(sheet)
-    rows = sheet.get_all_values()
-    id_col = hmap.get("id", 0)
-
-    for row_num, row in enumerate(rows[1:], start=2):
-        if len(row) > id_col and row[id_col] == todo_id:
-            old = _row_to_dict(row, hmap)
-            data = {
-                "id": todo_id,
-                "title": title,
-                "description": description,
-                "priority": priority if priority in VALID_PRIORITIES else "Medium",
-                "status": old.get("status", "open"),
-                "due_at": due_at,
-                "created_at": old.get("created_at", ""),
-                "updated_at": _now_iso(),
-                "done_at": old.get("done_at", ""),
-                "last_reminded_at": old.get("last_reminded_at", ""),
-            }
-            end_col = _col_letter(len(HEADERS) - 1)
-            sheet.update(
-                f"A{row_num}:{end_col}{row_num}",
-                [_dict_to_row(data)],
-                value_input_option="USER_ENTERED",
-            )
-            return
+    # id→行番号の対応表はシートの手編集で古くなりうるので、書き込み前に id を読んで確かめる
+    found = _read_row(sheet, todo_id, _ID_CELL_RANGE)
+    if found is None:
+        return
+
+    row_num = found[0]
+    if priority not in VALID_PRIORITIES:
+        priority = "Medium"
+    now = _now_iso()
+    # 変更したセルだけを1回の batchUpdate で書き込む（id / status / created_at には触れない）
+    _batch_write(sheet, [
+        {"range": _EDIT_FIELDS_RANGE % (row_num, row_num), "values": [[title, description, priority]]},
+        {"range": _DUE_AT_RANGE % row_num, "values": [[due_at]]},
+        {"range": _UPDATED_AT_RANGE % row_num, "values": [[now]]},
+    ])
+    todo_mirror.update([(row_num, {
+        "id": todo_id,
+        "title": title,
+        "description": description,
+        "priority": priority,
+        "due_at": due_at,
+        "updated_at": now,
+    })])
+    _invalidate_todo_cache()
 
 
+@_tracked
 def toggle_status(todo_id: str) -> str | None:
     """open↔done を切り替え。新しい status を返す。対象なければ None。"""
     sheet = _get_sheet()
-    _ensure_headers(sheet)
-    hmap = get_header_map(sheet)
-    rows = sheet.get_all_values()
-    id_col = hmap.get("id", 0)
-
-    for row_num, row in enumerate(rows[1:], start=2):
-        if len(row) > id_col and row[id_col] == todo_id:
-            old = _row_to_dict(row, hmap)
-            now = _now_iso()
-            new_status = "done" if old.get("status") != "done" else "open"
-            data = {
-                **old,
-                "status": new_status,
-                "done_at": now if new_status == "done" else "",
-                "updated_at": now,
-            }
-            end_col = _col_letter(len(HEADERS) - 1)
-            sheet.update(
-                f"A{row_num}:{end_col}{row_num}",
-                [_dict_to_row(data)],
-                value_input_option="USER_ENTERED",
-            )
-            return new_status
-    return None
+    # 切り替え方向は最新の status で決める（他ワーカーやシート上の変更を踏まない）
+    found = _read_row(sheet, todo_id, _STATUS_ROW_RANGE)
+    if found is None:
+        return None
+
+    row_num, row = found
+    status = row[_HEADER_INDEX["status"]] if len(row) > _HEADER_INDEX["status"] else ""
+    now = _now_iso()
+    new_status = "done" if status != "done" else "open"
+    done_at = now if new_status == "done" else ""
+    # status / updated_at / done_at のセルだけを書き換える
+    _batch_write(sheet, [
+        {"range": _STATUS_RANGE % row_num, "values": [[new_status]]},
+        {"range": _UPDATED_DONE_RANGE % (row_num, row_num), "values": [[now, done_at]]},
+    ])
+    todo_mirror.update([(row_num, {
+        "id": todo_id,
+        "status": new_status,
+        "done_at": done_at,
+        "updated_at": now,
+    })])
+    _invalidate_todo_cache()
+    return new_status
 
 
+@_tracked
 def find_due_within(hours: int = 24) -> list[dict]:
     """status=open & due_at が now〜now+hours 以内のTodoを抽出（重複通知抑制つき）。"""
-    todos = fetch_all_todos()
+    todos = _fetch_todos(HEADERS, _ALL_RANGE)
     tz = _get_tz()
     now = datetime.now(tz)
     window_end = now + timedelta(hours=hours)
+    # ループ内では tz 付き datetime 同士の演算を避け、epoch 秒で比較する
+    now_ts = now.timestamp()
+    end_ts = window_end.timestamp()
+    window_seconds = hours * 3600
+    # ISO8601 の日付部分は辞書順で比較できるので、まず文字列で大まかに絞り込む。
+    # オフセット差を吸収するため前後1日の余裕を持たせ、残った候補だけを厳密に判定する。
+    one_day = timedelta(days=1)
+    due_lo = (now - one_day).date().isoformat()
+    due_hi = (window_end + one_day).date().isoformat()
+    reminded_lo = (now - timedelta(hours=hours) - one_day).date().isoformat()
     result = []
 
     for t in todos:
         if t.get("status") != "open":
             continue
-        due = _parse_iso(t.get("due_at", ""))
+        due_str = (t.get("due_at") or "").strip()
+        if not (due_lo <= due_str[:10] <= due_hi):
+            continue
+        due = _parse_iso(due_str)
         if due is None:
             continue
         if due.tzinfo is None:
             due = due.replace(tzinfo=tz)
-        if not (now <= due <= window_end):
+        if not (now_ts <= due.timestamp() <= end_ts):
             continue
-        last = _parse_iso(t.get("last_reminded_at", ""))
-        if last is not None:
-            if last.tzinfo is None:
-                last = last.replace(tzinfo=tz)
-            if (now - last).total_seconds() < hours * 3600:
-                continue
+        last_str = (t.get("last_reminded_at") or "").strip()
+        if last_str[:10] >= reminded_lo:
+            last = _parse_iso(last_str)
+            if last is not None:
+                if last.tzinfo is None:
+                    last = last.replace(tzinfo=tz)
+                if now_ts - last.timestamp() < window_seconds:
+                    continue
         result.append(t)
 
     return result
 
 
-def mark_reminded(todo_ids: list[str], reminded_at: str = "") -> None:
-    """指定IDの last_reminded_at を一括更新。"""
+@_tracked
+def find_row_numbers(todo_ids: list[str]) -> list[int]:
+    """指定IDが存在する行番号の一覧を返す（id 列のみ読み取り）。"""
     if not todo_ids:
+        return []
+    sheet = _get_sheet()
+    hmap = _ensure_headers_once(sheet)
+    # 書き込み先の行番号になるので対応表は使わず、毎回 id 列を読んで対応表も更新する
+    ids = sheet.col_values(hmap.get("id", 0) + 1)
+    _store_id_index(ids[1:])
+    index = _ID_INDEX
+    return sorted({index[todo_id] for todo_id in todo_ids if todo_id in index})
+
+
+@_tracked
+def mark_reminded_rows(row_nums: list[int], reminded_at: str = "") -> None:
+    """指定行の last_reminded_at を1回の batchUpdate で更新。"""
+    if not row_nums:
         return
     if not reminded_at:
         reminded_at = _now_iso()
 
     sheet = _get_sheet()
-    _ensure_headers(sheet)
-    hmap = get_header_map(sheet)
-    rows = sheet.get_all_values()
-    id_col = hmap.get("id", 0)
+    hmap = _ensure_headers_once(sheet)
     reminded_col = hmap.get("last_reminded_at")
     if reminded_col is None:
         return
 
-    id_set = set(todo_ids)
-    cells = []
-    for row_num, row in enumerate(rows[1:], start=2):
-        if len(row) > id_col and row[id_col] in id_set:
-            cells.append(
-                gspread.Cell(row=row_num, col=reminded_col + 1, value=reminded_at)
-            )
+    col = _col_letter(reminded_col)
+    _batch_write(
+        sheet,
+        [{"range": f"{col}{row_num}", "values": [[reminded_at]]} for row_num in row_nums],
+    )
+    todo_mirror.update_rows(row_nums, {"last_reminded_at": reminded_at})
+
+
+@_tracked
+def mark_reminded(todo_ids: list[str], reminded_at: str = "") -> None:
+    """指定IDの last_reminded_at を一括更新。"""
+    mark_reminded_rows(find_row_numbers(todo_ids), reminded_at)
+
+
+# ── Async wrappers ───────────────────────────────────────────────────
+# gspread は同期 API のため、スレッドで実行して await 可能にする。
+# 独立した Sheets 呼び出しを asyncio.gather で重ねれば待ち時間は最長の1回分になる。
+
+async def async_fetch_all_todos() -> list[dict]:
+    return await asyncio.to_thread(fetch_all_todos)
+
+
+async def async_fetch_todo_by_id(todo_id: str) -> dict | None:
+    return await asyncio.to_thread(fetch_todo_by_id, todo_id)
+
+
+async def async_create_todo(
+    title: str,
+    description: str = "",
+    priority: str = "Medium",
+    due_at: str = "",
+) -> None:
+    await asyncio.to_thread(create_todo, title, description, priority, due_at)
+
+
+async def async_update_todo(
+    todo_id: str,
+    title: str,
+    description: str = "",
+    priority: str = "Medium",
+    due_at: str = "",
+) -> None:
+    await asyncio.to_thread(update_todo, todo_id, title, description, priority, due_at)
+
+
+async def async_toggle_status(todo_id: str) -> str | None:
+    return await asyncio.to_thread(toggle_status, todo_id)
+
 
-    if cells:
-        sheet.update_cells(cells, value_input_option="USER_ENTERED")
+async def async_find_row_numbers(todo_ids: list[str]) -> list[int]:
+    return await asyncio.to_thread(find_row_numbers, todo_ids)
@@ -0,0 +1,65 @@
+import unittest
+
+import todo_mirror
+
+COLUMNS = ("id", "title", "status", "updated_at", "last_reminded_at")
+
+
+def _todo(todo_id, title, status="open"):
+    return {"id": todo_id, "title": title, "status": status, "updated_at": "u0", "last_reminded_at": ""}
+
+
+class TodoMirrorTest(unittest.TestCase):
+    def setUp(self):
+        todo_mirror.open_mirror(COLUMNS, [(2, _todo("a1", "first")), (3, _todo("a2", "second"))])
+
+    def tearDown(self):
+        todo_mirror.close()
+
+    def test_all_todos_in_row_order(self):
+        todo_mirror.insert([(4, _todo("a0", "third"))])
+        self.assertEqual([t["id"] for t in todo_mirror.all_todos()], ["a1", "a2", "a0"])
+
+    def test_update_changes_only_given_columns(self):
+        todo_mirror.update([(2, {"id": "a1", "status": "done", "updated_at": "u1"})])
+        self.assertEqual(
+            todo_mirror.get("a1"),
+            (2, {"id": "a1", "title": "first", "status": "done", "updated_at": "u1", "last_reminded_at": ""}),
+        )
+
+    def test_update_skips_unknown_id(self):
+        todo_mirror.update([(5, {"id": "b2", "status": "done", "updated_at": "u1"})])
+        self.assertIsNone(todo_mirror.get("b2"))
+        self.assertEqual(len(todo_mirror.all_todos()), 2)
+
+    def test_update_moves_row_number(self):
+        todo_mirror.update([(3, {"id": "a1", "title": "moved"})])
+        self.assertEqual(todo_mirror.get("a1")[0], 3)
+
+    def test_replace_all_replaces_rows(self):
+        gen = todo_mirror.write_gen()
+        self.assertTrue(todo_mirror.replace_all([(2, _todo("c1", "fresh"))], gen))
+        self.assertEqual([t["id"] for t in todo_mirror.all_todos()], ["c1"])
+        self.assertIsNone(todo_mirror.get("a1"))
+
+    def test_replace_all_skipped_after_local_write(self):
+        gen = todo_mirror.write_gen()
+        todo_mirror.update([(2, {"id": "a1", "title": "local edit"})])
+        self.assertFalse(todo_mirror.replace_all([(2, _todo("a1", "stale"))], gen))
+        self.assertEqual(todo_mirror.get("a1")[1]["title"], "local edit")
+
+    def test_update_rows_by_row_number(self):
+        todo_mirror.update_rows([3], {"last_reminded_at": "r1"})
+        self.assertEqual(todo_mirror.get("a1")[1]["last_reminded_at"], "")
+        self.assertEqual(todo_mirror.get("a2")[1]["last_reminded_at"], "r1")
+
+    def test_closed_mirror_is_noop(self):
+        todo_mirror.close()
+        todo_mirror.update([(2, {"id": "a1", "title": "x"})])
+        self.assertEqual(todo_mirror.all_todos(), [])
+        self.assertIsNone(todo_mirror.get("a1"))
+        self.assertFalse(todo_mirror.replace_all([], todo_mirror.write_gen()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Todo の読み取り用 SQLite ミラー。
+責務: ミラーの保存・検索のみ。Sheets との同期（全件取り込み・書き込み後の反映）は sheets_client が行う。
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+# 接続は全スレッドで共有し、読み書きはすべて _lock の中で行う。
+# ミラーはワーカー（プロセス）ごとにメモリ上に持つ（ファイルを共有すると互いの作り直しが衝突する）。
+_STATE = {"conn": None, "columns": (), "gen": 0}
+_lock = threading.Lock()
+
+
+def is_open() -> bool:
+    return _STATE["conn"] is not None
+
+
+def open_mirror(columns: tuple[str, ...], rows: list[tuple[int, dict]]) -> None:
+    """ミラーを作り、rows（(行番号, Todo) の一覧）で初期化する。columns[0] は id。"""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE todos (id TEXT PRIMARY KEY, %s, row_num INTEGER)"
+        % ", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in columns[1:])
+    )
+    with _lock:
+        _STATE["columns"] = tuple(columns)
+        _insert_all(conn, rows)
+        _STATE["conn"] = conn
+
+
+def close() -> None:
+    """ミラーを閉じる（テスト・設定変更用）。"""
+    with _lock:
+        conn = _STATE["conn"]
+        _STATE["conn"] = None
+    if conn is not None:
+        conn.close()
+
+
+def write_gen() -> int:
+    """ミラーへの書き込みのたびに増える世代番号。取り込み中の書き込み検出に使う。"""
+    return _STATE["gen"]
+
+
+def replace_all(rows: list[tuple[int, dict]], gen: int) -> bool:
+    """全件を rows で置き換える。gen 以降に書き込みがあれば何もせず False を返す。"""
+    with _lock:
+        conn = _STATE["conn"]
+        if conn is None or _STATE["gen"] != gen:
+            return False
+        conn.execute("DELETE FROM todos")
+        _insert_all(conn, rows)
+    return True
+
+
+def insert(rows: list[tuple[int, dict]]) -> None:
+    """新規行（(行番号, 全列の Todo)）を追加する。"""
+    with _lock:
+        conn = _STATE["conn"]
+        if conn is None:
+            return
+        _insert_all(conn, rows)
+        _STATE["gen"] += 1
+
+
+def update(rows: list[tuple[int, dict]]) -> None:
+    """(行番号, id と変更した列) を反映する。ミラーにない id は追加せず読み飛ばす。
+
+    一部の列だけで行を作ると残りが空になるため、未取り込みの行は次の全件取り込みに任せる。
+    """
+    with _lock:
+        conn = _STATE["conn"]
+        if conn is None:
+            return
+        with conn:
+            for row_num, fields in rows:
+                cols = [c for c in _STATE["columns"][1:] if c in fields]
+                conn.execute(
+                    "UPDATE todos SET %s WHERE id = ?"
+                    % ", ".join(f"{c} = ?" for c in cols + ["row_num"]),
+                    [fields[c] for c in cols] + [row_num, fields["id"]],
+                )
+        _STATE["gen"] += 1
+
+
+def update_rows(row_nums: list[int], fields: dict) -> None:
+    """指定行番号の行に fields を書き込む。"""
+    with _lock:
+        conn = _STATE["conn"]
+        if conn is None:
+            return
+        cols = [c for c in _STATE["columns"] if c in fields]
+        with conn:
+            conn.executemany(
+                "UPDATE todos SET %s WHERE row_num = ?"
+                % ", ".join(f"{c} = ?" for c in cols),
+                [[fields[c] for c in cols] + [row_num] for row_num in row_nums],
+            )
+        _STATE["gen"] += 1
+
+
+def all_todos() -> list[dict]:
+    """全Todoをシートの行順で返す。"""
+    with _lock:
+        conn = _STATE["conn"]
+        if conn is None:
+            return []
+        columns = _STATE["columns"]
+        rows = conn.execute(
+            "SELECT %s FROM todos ORDER BY row_num" % ", ".join(columns)
+        ).fetchall()
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def get(todo_id: str) -> tuple[int, dict] | None:
+    """指定IDの (行番号, Todo) を返す。なければ None。"""
+    with _lock:
+        conn = _STATE["conn"]
+        if conn is None:
+            return None
+        columns = _STATE["columns"]
+        row = conn.execute(
+            "SELECT row_num, %s FROM todos WHERE id = ?" % ", ".join(columns),
+            (todo_id,),
+        ).fetchone()
+    if row is None:
+        return None
+    return row[0], dict(zip(columns, row[1:]))
+
+
+def _insert_all(conn, rows: list[tuple[int, dict]]) -> None:
+    columns = _STATE["columns"]
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO todos (%s, row_num) VALUES (%s)"
+            % (", ".join(columns), ", ".join("?" * (len(columns) + 1))),
+            [[todo.get(c, "") for c in columns] + [row_num] for row_num, todo in rows],
+        )